@@ -1,17 +1,47 @@
+import json
+import os
 import requests
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 
 # ------------------------------------
 # 1. Fetch Data from Public API
 # ------------------------------------
 url = "https://jsonplaceholder.typicode.com/posts"
-response = requests.get(url)
+cache_file = "posts_cache.json"   # ETag + last payload, reused on 304
+show_individual_plots = False     # the dashboard (section 4) already shows both charts
 
-data = response.json()
+cached_data = None
+headers = {}
+if os.path.exists(cache_file):
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        headers["If-None-Match"] = cached["etag"]
+        cached_data = cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        # truncated or hand-edited cache: ignore it and fetch fresh
+        cached_data = None
+        headers = {}
 
-# Convert to DataFrame
-df = pd.DataFrame(data)
+session = requests.Session()
+response = session.get(url, headers=headers)
+
+if response.status_code == 304 and cached_data is not None:
+    data = cached_data
+else:
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "data": data}, f)
+
+# Convert to DataFrame (Arrow-backed columns, strings kept in contiguous UTF-8 buffers)
+tbl = pa.Table.from_pylist(data)
+df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
 
 print("Data Loaded Successfully!")
 print(df.head())
@@ -19,39 +49,62 @@ print(df.head())
 # ------------------------------------
 # 2. Visualization 1: Bar chart of post lengths
 # ------------------------------------
-df["body_length"] = df["body"].apply(len)
+# body is string[pyarrow], so .str.len() runs Arrow's UTF-8 length kernel
+df["body_length"] = df["body"].str.len()
+ids = df["id"].to_numpy()
+body_length_array = df["body_length"].to_numpy()
 
-plt.figure(figsize=(10,5))
-plt.bar(df["id"], df["body_length"])
-plt.title("Post Body Length for Each Post")
-plt.xlabel("Post ID")
-plt.ylabel("Length of Body Text")
-plt.show()
+# Bar corners (N, 4, 2) computed once; each plot draws them as a single PolyCollection
+left, right = ids - 0.4, ids + 0.4
+zeros = np.zeros_like(body_length_array)
+bar_verts = np.stack([
+    np.column_stack([left, zeros]),
+    np.column_stack([left, body_length_array]),
+    np.column_stack([right, body_length_array]),
+    np.column_stack([right, zeros]),
+], axis=1)
+
+def draw_bars(ax):
+    """Draw all posts as one PolyCollection of bars on ax."""
+    bars = PolyCollection(bar_verts, facecolors="C0")
+    bars.sticky_edges.y.append(0)   # like bar(): y axis starts at 0
+    ax.add_collection(bars)
+    ax.autoscale_view()
+
+# Bin once; both histogram renders reuse these counts
+counts, edges = np.histogram(body_length_array, bins=10)
+
+if show_individual_plots:
+    plt.figure(figsize=(10,5))
+    draw_bars(plt.gca())
+    plt.title("Post Body Length for Each Post")
+    plt.xlabel("Post ID")
+    plt.ylabel("Length of Body Text")
+    plt.show()
 
 # ------------------------------------
 # 3. Visualization 2: Histogram of text length
 # ------------------------------------
-plt.figure(figsize=(10,5))
-plt.hist(df["body_length"], bins=10)
-plt.title("Distribution of Post Body Length")
-plt.xlabel("Length")
-plt.ylabel("Frequency")
-plt.show()
+if show_individual_plots:
+    plt.figure(figsize=(10,5))
+    plt.stairs(counts, edges, fill=True)
+    plt.title("Distribution of Post Body Length")
+    plt.xlabel("Length")
+    plt.ylabel("Frequency")
+    plt.show()
 
 # ------------------------------------
 # 4. Visualization Dashboard
 # ------------------------------------
-plt.figure(figsize=(14,6))
+fig, axes = plt.subplots(1, 2, figsize=(14,6))
 
 # Subplot 1
-plt.subplot(1,2,1)
-plt.bar(df["id"], df["body_length"])
-plt.title("Body Length per Post")
+draw_bars(axes[0])
+axes[0].set_title("Body Length per Post")
 
 # Subplot 2
-plt.subplot(1,2,2)
-plt.hist(df["body_length"], bins=10)
-plt.title("Length Distribution")
+axes[1].stairs(counts, edges, fill=True)
+axes[1].set_title("Length Distribution")
 
 plt.tight_layout()
 plt.show()
@@ -1,48 +1,66 @@
 import pandas as pd
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 
 # ------------------------------------------------------
 # 1. Load Data from CSV
 # ------------------------------------------------------
 data_file = "D:/SAHIL CODE IT/data.csv"   # Make sure data.csv is in same folder
-df = pd.read_csv(data_file)
 
-# Sample Analysis
-avg_score = df['Score'].mean()
-max_score = df['Score'].max()
-min_score = df['Score'].min()
+# Sample Analysis (single streaming pass over the Score column)
+total, count = 0.0, 0
+max_score, min_score = float('nan'), float('nan')   # as Series.max/min report no data
+for chunk in pd.read_csv(data_file, usecols=['Score'], chunksize=200_000):
+    scores = chunk['Score'].dropna().to_numpy()
+    if scores.size == 0:
+        continue
+    chunk_max, chunk_min = scores.max(), scores.min()
+    if count == 0:
+        max_score, min_score = chunk_max, chunk_min
+    else:
+        max_score, min_score = max(max_score, chunk_max), min(min_score, chunk_min)
+    total += scores.sum()
+    count += scores.size
+
+avg_score = total / count if count else float('nan')
 
 # ------------------------------------------------------
 # 2. Create PDF Report
 # ------------------------------------------------------
 pdf_file = "generated_report.pdf"
 styles = getSampleStyleSheet()
+# Spacing lives on the styles (spaceAfter) rather than in separate Spacer flowables
+title_style = ParagraphStyle('ReportTitle', parent=styles['Title'], spaceAfter=20)
+body_style = ParagraphStyle('ReportBody', parent=styles['BodyText'], spaceAfter=12)
+heading_style = ParagraphStyle('ReportHeading', parent=styles['Heading2'], spaceAfter=10)
 story = []
 
 doc = SimpleDocTemplate(pdf_file, pagesize=A4)
 
 # Title
-story.append(Paragraph("Automated Data Analysis Report", styles['Title']))
-story.append(Spacer(1, 20))
+story.append(Paragraph("Automated Data Analysis Report", title_style))
 
 # Intro
-story.append(Paragraph("This report is automatically generated using Python.", styles['BodyText']))
-story.append(Spacer(1, 12))
+story.append(Paragraph("This report is automatically generated using Python.", body_style))
 
 # File Used
-story.append(Paragraph(f"Input Data File: {data_file}", styles['BodyText']))
-story.append(Spacer(1, 12))
+story.append(Paragraph(f"Input Data File: {data_file}", body_style))
 
 # Analysis Section
-story.append(Paragraph("Analysis Summary:", styles['Heading2']))
-story.append(Spacer(1, 10))
+story.append(Paragraph("Analysis Summary:", heading_style))
 
-story.append(Paragraph(f"📌 Average Score: {avg_score:.2f}", styles['BodyText']))
-story.append(Paragraph(f"📌 Highest Score: {max_score}", styles['BodyText']))
-story.append(Paragraph(f"📌 Lowest Score: {min_score}", styles['BodyText']))
-story.append(Spacer(1, 20))
+rows = [
+    ["Metric", "Value"],
+    ["Average Score", f"{avg_score:.2f}"],
+    ["Highest Score", max_score],
+    ["Lowest Score", min_score],
+]
+story.append(Table(rows, hAlign='LEFT', spaceAfter=20, style=TableStyle([
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+])))
 
 # Completion note
 story.append(Paragraph("Report generated successfully using Python and ReportLab.", styles['Italic']))
@@ -3,41 +3,77 @@
 # Project: Machine Learning Model Implementation (Predictive Model)
 
 # Step 1: Import Libraries
+import hashlib
+import os
+import urllib.request
+import joblib
 import pandas as pd
 import numpy as np
+import sklearn
 from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
-import seaborn as sns
 import matplotlib.pyplot as plt
 
 # Step 2: Load Dataset
 # Using a sample dataset available online (SMS Spam Collection)
 url = "https://raw.githubusercontent.com/justmarkham/pycon-2016-tutorial/master/data/sms.tsv"
-df = pd.read_csv(url, sep='\t', header=None, names=['label', 'message'])
+local_tsv = "sms.tsv"   # downloaded once, reused on later runs
+if not os.path.exists(local_tsv):
+    # download to a temp name first so an interrupted run never leaves a truncated sms.tsv
+    urllib.request.urlretrieve(url, local_tsv + ".part")
+    os.replace(local_tsv + ".part", local_tsv)
+df = pd.read_csv(local_tsv, sep='\t', header=None, names=['label', 'message'])
 
 # Display first few rows
 print("📊 Dataset Preview:")
 print(df.head())
 
 # Step 3: Data Preprocessing
-# Convert labels: 'ham' -> 0, 'spam' -> 1
-df['label_num'] = df['label'].map({'ham': 0, 'spam': 1})
+# Convert labels: 'ham' -> 0, 'spam' -> 1 (vectorized compare, int8 target)
+df['label_num'] = (df['label'].to_numpy() == 'spam').astype(np.int8)
 
 # Step 4: Split Data into Training and Testing
+split_params = dict(test_size=0.2, random_state=42)
 X_train, X_test, y_train, y_test = train_test_split(
-    df['message'], df['label_num'], test_size=0.2, random_state=42
+    df['message'], df['label_num'], **split_params
 )
 
-# Step 5: Text Vectorization (Convert text to numbers)
-vectorizer = CountVectorizer(stop_words='english')
-X_train_vec = vectorizer.fit_transform(X_train)
-X_test_vec = vectorizer.transform(X_test)
-
-# Step 6: Model Training (Naive Bayes Classifier)
+# Step 5 & 6: Text Vectorization + Model Training (Naive Bayes Classifier)
+# Stateless hashing: no vocabulary to fit, float32 counts, non-negative for MultinomialNB
+vectorizer = HashingVectorizer(n_features=2**18, alternate_sign=False, norm=None,
+                               dtype=np.float32, stop_words='english')
 model = MultinomialNB()
-model.fit(X_train_vec, y_train)
+
+# The trained (vectorizer, model) pair is cached, keyed by the dataset file plus everything
+# that shapes training (pipeline params, split, sklearn version), so config changes retrain
+sig = hashlib.sha1()
+with open(local_tsv, "rb") as f:
+    sig.update(f.read())
+sig.update(repr((type(vectorizer).__name__, sorted(vectorizer.get_params().items()),
+                 type(model).__name__, sorted(model.get_params().items()),
+                 sorted(split_params.items()), sklearn.__version__)).encode())
+model_cache = f"spam_{sig.hexdigest()[:12]}.joblib"
+
+cached = None
+if os.path.exists(model_cache):
+    try:
+        cached = joblib.load(model_cache)
+        print(f"\n💾 Loaded trained model from {model_cache}")
+    except Exception as e:
+        print(f"\n⚠ Could not load {model_cache} ({e}), retraining")
+
+if cached is not None:
+    vectorizer, model = cached
+else:
+    X_train_vec = vectorizer.transform(X_train)
+    model.fit(X_train_vec, y_train)
+    # dump to a temp name first so an interrupted write never leaves a truncated cache
+    joblib.dump((vectorizer, model), model_cache + ".part", compress=3)
+    os.replace(model_cache + ".part", model_cache)
+
+X_test_vec = vectorizer.transform(X_test)
 
 # Step 7: Make Predictions
 y_pred = model.predict(X_test_vec)
@@ -51,7 +87,14 @@ print(classification_report(y_test, y_pred, target_names=['Ham', 'Spam']))
 
 # Step 9: Confusion Matrix
 cm = confusion_matrix(y_test, y_pred)
-sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', xticklabels=['Ham', 'Spam'], yticklabels=['Ham', 'Spam'])
+fig, ax = plt.subplots()
+im = ax.imshow(cm, cmap='Blues')
+fig.colorbar(im, ax=ax)
+for (i, j), v in np.ndenumerate(cm):
+    ax.text(j, i, v, ha='center', va='center',
+            color='white' if v > cm.max() / 2 else 'black')
+ax.set_xticks([0, 1], labels=['Ham', 'Spam'])
+ax.set_yticks([0, 1], labels=['Ham', 'Spam'])
 plt.xlabel('Predicted')
 plt.ylabel('Actual')
 plt.title('Confusion Matrix - Spam Detection')
@@ -66,7 +109,7 @@ test_messages = [
 
 test_vec = vectorizer.transform(test_messages)
 predictions = model.predict(test_vec)
+labels = np.where(predictions == 1, "SPAM", "HAM")
 
-for msg, pred in zip(test_messages, predictions):
-    label = "SPAM" if pred == 1 else "HAM"
-    print(f"📩 Message: {msg}\n➡ Prediction: {label}\n")
+print("\n".join(f"📩 Message: {msg}\n➡ Prediction: {label}\n"
+                for msg, label in zip(test_messages, labels)))
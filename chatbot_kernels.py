@@ -0,0 +1,42 @@
+"""
+chatbot_kernels.py
+
+Numba kernels for simple_ai_chatbot.py (Task 3.py). Kept in their own module so
+numba is only imported when a large KB needs them, and so cache=True can reuse
+the compiled code from __pycache__ across runs (it can't for nested functions).
+"""
+
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _is_space(c):
+    # ASCII characters matched by \s and removed by str.strip()
+    return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+
+@njit(parallel=True, cache=True)
+def preprocess_ascii(buf, offsets, out, out_lens):
+    """Numba version of preprocess() over many ASCII strings packed into one byte buffer."""
+    for i in prange(offsets.size - 1):
+        start = offsets[i]
+        end = offsets[i + 1]
+        while start < end and _is_space(buf[start]):
+            start += 1
+        while end > start and _is_space(buf[end - 1]):
+            end -= 1
+        pos = offsets[i]
+        prev_space = False
+        for j in range(start, end):
+            c = buf[j]
+            if 65 <= c <= 90:
+                c += 32
+            if (97 <= c <= 122) or (48 <= c <= 57) or c == 95 or c == 63 or c == 39:
+                out[pos] = c
+                pos += 1
+                prev_space = False
+            elif not prev_space:
+                out[pos] = 32
+                pos += 1
+                prev_space = True
+        out_lens[i] = pos - offsets[i]